@@ -11,25 +11,38 @@
 import math
 import argparse
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# math.log2 без поиска атрибута модуля на каждом вызове
+_log2 = math.log2
+
+# log2(48) из приближения объёма V ≈ K·220·log2(48) — считаем один раз при импорте
+_LOG2_48 = math.log2(48.0)
 
 
 # -----------------------------
 # 1) Структура данных варианта
 # -----------------------------
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VariantData:
-    # Параметры варианта лабораторной
-    targets: int                 # число целей (объектов наблюдения)
-    measurements_per_param: int  # число измерений на один параметр
-    tracked_params: int          # число отслеживаемых параметров
-    calculated_params: int       # число вычисляемых параметров
-    R0: float                    # начальный рейтинг (R_0)
-    lambda_lang: float           # языковой коэффициент λ
-    n_programs: int              # число уже написанных программ
-    volumes_kb: List[float]      # объёмы уже написанных программ (Кбайт)
-    errors_list: List[int]       # найденные ошибки в этих программах
-    planned_kb: int              # планируемый объём следующей программы (Кбайт)
+    # Параметры варианта лабораторной (неизменяемые, поэтому вариант можно использовать как ключ словаря)
+    targets: int                   # число целей (объектов наблюдения)
+    measurements_per_param: int    # число измерений на один параметр
+    tracked_params: int            # число отслеживаемых параметров
+    calculated_params: int         # число вычисляемых параметров
+    R0: float                      # начальный рейтинг (R_0)
+    lambda_lang: float             # языковой коэффициент λ
+    n_programs: int                # число уже написанных программ
+    volumes_kb: Tuple[float, ...]  # объёмы уже написанных программ (Кбайт)
+    errors_list: Tuple[int, ...]   # найденные ошибки в этих программах
+    planned_kb: int                # планируемый объём следующей программы (Кбайт)
+
+    def __post_init__(self):
+        # списки (как в исходном формате List[float] / List[int]) приводятся к кортежам,
+        # чтобы вариант оставался хешируемым
+        object.__setattr__(self, "volumes_kb", tuple(self.volumes_kb))
+        object.__setattr__(self, "errors_list", tuple(self.errors_list))
 
 
 # -----------------------------
@@ -45,8 +58,8 @@ TABLE: Dict[int, VariantData] = {
         R0=2000.0,
         lambda_lang=1.6,
         n_programs=3,
-        volumes_kb=[4.0, 8.0, 10.0],
-        errors_list=[1, 2, 4],
+        volumes_kb=(4.0, 8.0, 10.0),
+        errors_list=(1, 2, 4),
         planned_kb=14
     )
 }
@@ -59,7 +72,7 @@ def log2(x: float) -> float:
     """Безопасный логарифм по основанию 2."""
     if x <= 0:
         raise ValueError("log2: аргумент должен быть > 0")
-    return math.log(x, 2)
+    return math.log2(x)
 
 
 def compute_n2_star(data: VariantData) -> int:
@@ -72,17 +85,24 @@ def compute_n2_star(data: VariantData) -> int:
     return data.targets * (data.measurements_per_param * data.tracked_params + data.calculated_params)
 
 
+# Три следующие функции (halstead_potential_volume, modules_count, program_length) —
+# чистые функции от n2* и K, поэтому их результаты кэшируются (lru_cache):
+# при переборе параметров логарифмы для одних и тех же аргументов считаются один раз.
+@lru_cache(maxsize=None)
 def halstead_potential_volume(n2_star: int) -> float:
     """Потенциальный объём по Холстеду: V* = (2 + n2*) * log2(2 + n2*)."""
-    return (2 + n2_star) * log2(2 + n2_star)
+    # 2 + n2* > 0 при n2* >= 0, поэтому проверка из log2() здесь не нужна
+    return (2 + n2_star) * _log2(2 + n2_star)
 
 
+@lru_cache(maxsize=None)
 def modules_count(n2_star: int) -> Tuple[float, int]:
     """Число модулей: сырое и округлённое вверх (k_raw и k_simple)."""
-    k_raw = n2_star / 8.0
-    return k_raw, math.ceil(k_raw)
+    # ceil(n2*/8) как -(-n2* // 8): без вызова math.ceil, работает и для int, и для float
+    return n2_star / 8.0, int(-(-n2_star // 8))
 
 
+@lru_cache(maxsize=None)
 def program_length(K: int) -> float:
     """
     Длина программы N = 220·K + K·log2(K).
@@ -90,7 +110,7 @@ def program_length(K: int) -> float:
     """
     if K <= 0:
         raise ValueError("K должно быть > 0")
-    return 220.0 * K + K * log2(K)
+    return 220.0 * K + K * _log2(K)
 
 
 def asm_commands(N: float) -> float:
@@ -118,6 +138,14 @@ def potential_errors_task2(V: float) -> float:
     return V / 3000.0
 
 
+# Формулы коэффициента c(λ, R) по номеру варианта
+_C_COEFS = {
+    1: lambda lambd, R: 1.0 / (lambd + R),
+    2: lambda lambd, R: 1.0 / (lambd * R),
+    3: lambda lambd, R: (1.0 / lambd) + (1.0 / R),
+}
+
+
 def c_coef(variant: int, lambd: float, R: float) -> float:
     """
     Коэффициент c(λ, R) — три варианта (по условию лабораторной).
@@ -127,16 +155,19 @@ def c_coef(variant: int, lambd: float, R: float) -> float:
       - variant 3: c = 1/λ + 1/R
     Это влияет на знак B_expected_next в задании 3.
     """
-    if variant == 1:
-        return 1.0 / (lambd + R)
-    if variant == 2:
-        return 1.0 / (lambd * R)
-    if variant == 3:
-        return (1.0 / lambd) + (1.0 / R)
-    raise ValueError("Неизвестный вариант коэффициента c")
-
-
-def compute_rating_and_expected_errors(data: VariantData, coef_variant: int, R_prev: float) -> Tuple[float, float]:
+    formula = _C_COEFS.get(variant)
+    if formula is None:
+        raise ValueError("Неизвестный вариант коэффициента c")
+    return formula(lambd, R)
+
+
+def compute_rating_and_expected_errors(
+    data: VariantData,
+    coef_variant: int,
+    R_prev: float,
+    sum_V: Optional[float] = None,
+    sum_B: Optional[int] = None,
+) -> Tuple[float, float]:
     """
     Задание 3 (реализация строго по методичке):
       R_i = R_{i-1} * [1 + 1e-3 * (Σ V_j − Σ B_k / c(λ, R_{i-1}))]
@@ -149,6 +180,9 @@ def compute_rating_and_expected_errors(data: VariantData, coef_variant: int, R_p
       что приведёт к отрицательному R_new. Это ожидаемое поведение модели.
     - Если R_new отрицателен, для вариантов 1 и 2 c(λ, R_new) также будет отрицательным,
       и B_expected_next (c · planned_kb) станет отрицательным — как вы и требовали.
+
+    sum_V и sum_B (Σ V_j и Σ B_k) можно передать заранее посчитанными,
+    чтобы не суммировать списки повторно для каждого варианта c.
     """
     # вычисляем c при предыдущем рейтинге
     c_prev = c_coef(coef_variant, data.lambda_lang, R_prev)
@@ -158,11 +192,14 @@ def compute_rating_and_expected_errors(data: VariantData, coef_variant: int, R_p
         # если c_prev практически ноль — сообщаем об ошибке, чтобы не делить на ноль
         raise ZeroDivisionError("c(λ, R_prev) почти ноль — деление приведёт к ошибке. Проверьте входные данные.")
 
-    # сумма объёмов уже написанных программ
-    sum_V = sum(data.volumes_kb)
+    # суммы объёмов уже написанных программ и найденных в них ошибок
+    if sum_V is None:
+        sum_V = sum(data.volumes_kb)
+    if sum_B is None:
+        sum_B = sum(data.errors_list)
 
     # ПО МЕТОДИЧКЕ: Σ B_k / c_prev  (именно деление)
-    sum_B_over_c = sum(data.errors_list) / c_prev
+    sum_B_over_c = sum_B / c_prev
 
     # вычисление нового рейтинга R_i
     R_new = R_prev * (1.0 + 1e-3 * (sum_V - sum_B_over_c))
@@ -175,13 +212,50 @@ def compute_rating_and_expected_errors(data: VariantData, coef_variant: int, R_p
     return R_new, B_expected_next
 
 
+def compute_all_ratings(data: VariantData, R_prev: float) -> Dict[int, Tuple[Optional[float], Optional[float]]]:
+    """
+    Задание 3 сразу для трёх вариантов коэффициента c.
+    Суммы Σ V_j и Σ B_k считаются один раз и используются во всех вариантах.
+    Возвращает {вариант c: (R_new, B_expected_next)}; при c_prev ≈ 0 — (None, None).
+    """
+    sum_V = sum(data.volumes_kb)
+    sum_B = sum(data.errors_list)
+
+    ratings = {}
+    for coef_variant in (1, 2, 3):
+        try:
+            ratings[coef_variant] = compute_rating_and_expected_errors(data, coef_variant, R_prev, sum_V, sum_B)
+        except ZeroDivisionError:
+            # в случае проблем (очень малое c_prev) возвращаем None
+            ratings[coef_variant] = (None, None)
+    return ratings
+
+
 # -----------------------------
-# Основной проход расчётов
+# Величины, не зависящие от m, ν и длины рабочего дня
 # -----------------------------
-def run_all_for_variant(data: VariantData, m: int, nu: int, work_day_hours: int) -> Dict:
+@dataclass(frozen=True)
+class _VariantConstants:
+    # Результаты заданий 1 и 2, которые определяются только данными варианта
+    n2_star: int
+    V_star: float
+    B1: float
+    k_raw: float
+    k_simple: int
+    K_used: int
+    N: float
+    V: float
+    P_asm: float
+    B2: float
+    t_k_factor: float  # 1/(2·ln B2) — множитель начальной надёжности t_k; ∞ при B2 ≤ 1
+    ratings: Dict[int, Tuple[Optional[float], Optional[float]]]  # Задание 3 при R_{i-1} = R0
+
+
+def _precompute(data: VariantData) -> _VariantConstants:
     """
-    Выполняет полный набор расчётов (Задание 1, Задание 2, Задание 3)
-    и возвращает словарь с результатами.
+    Проверяет данные варианта и считает всё, что не зависит от m, ν и work_day_hours
+    (задания 1, 2 без календарного времени и задание 3).
+    Для вариантов из TABLE результат вычисляется один раз при импорте (см. _PRECOMPUTED).
     """
     # базовые проверки корректности входных данных
     if data.targets <= 0:
@@ -190,10 +264,6 @@ def run_all_for_variant(data: VariantData, m: int, nu: int, work_day_hours: int)
         raise ValueError("measurements_per_param должен быть > 0")
     if data.n_programs != len(data.volumes_kb) or data.n_programs != len(data.errors_list):
         raise ValueError("n_programs должен соответствовать длине volumes_kb и errors_list")
-    if work_day_hours <= 0:
-        raise ValueError("work_day_hours должен быть > 0")
-    if m <= 0 or nu <= 0:
-        raise ValueError("m и nu должны быть > 0")
 
     # 1) n2* (минимальное число операндов)
     n2_star = compute_n2_star(data)
@@ -208,7 +278,8 @@ def run_all_for_variant(data: VariantData, m: int, nu: int, work_day_hours: int)
     k_raw, k_simple = modules_count(n2_star)
 
     # 5) иерархическая аппроксимация (если применимо)
-    K_hier = math.ceil(n2_star / 8.0 + n2_star / (8.0 ** 2))
+    # ceil(n2*/8 + n2*/8²) = ceil(9·n2*/64), считаем через целочисленное деление
+    K_hier = int(-(-9 * n2_star // 64))
     # выбираем K_hier при больших k_raw, иначе простое округление вверх
     K_used = K_hier if k_raw > 8.0 else k_simple
 
@@ -216,48 +287,93 @@ def run_all_for_variant(data: VariantData, m: int, nu: int, work_day_hours: int)
     N = program_length(K_used)
 
     # 7) объём ПО V (по приближению из методички)
-    V = K_used * 220.0 * log2(48.0)
+    V = K_used * 220.0 * _LOG2_48
 
     # 8) число ассемблерных команд P
     P_asm = asm_commands(N)
 
-    # 9) календарное время (в днях и часах)
-    Tk_days = calendar_time_days(N, m, nu)
-    Tk_hours = Tk_days * work_day_hours
-
     # 10) потенциальное количество ошибок по объёму (B2)
     B2 = potential_errors_task2(V)
 
+    # 11) множитель t_k = T_k / (2·ln B2) не зависит от T_k — логарифм считаем здесь;
+    # при B2 <= 1 логарифм не определён/неподходящая область — t_k считаем бесконечностью (T_k > 0)
+    t_k_factor = 1.0 / (2.0 * math.log(B2)) if B2 > 1.0 else math.inf
+
+    # 12) Задание 3 — рейтинги и ожидаемые ошибки для трёх вариантов c
+    ratings = compute_all_ratings(data, data.R0)
+
+    return _VariantConstants(
+        n2_star=n2_star,
+        V_star=V_star,
+        B1=B1,
+        k_raw=k_raw,
+        k_simple=k_simple,
+        K_used=K_used,
+        N=N,
+        V=V,
+        P_asm=P_asm,
+        B2=B2,
+        t_k_factor=t_k_factor,
+        ratings=ratings,
+    )
+
+
+# Предрасчёт для всех вариантов таблицы: повторные вызовы (например, перебор m, ν)
+# сводятся к поиску в словаре по самому (неизменяемому) варианту
+_PRECOMPUTED: Dict[VariantData, _VariantConstants] = {data: _precompute(data) for data in TABLE.values()}
+
+
+def _constants_for(data: VariantData) -> _VariantConstants:
+    """Возвращает предрасчитанные величины для варианта из TABLE или считает их заново."""
+    consts = _PRECOMPUTED.get(data)
+    if consts is None:
+        consts = _precompute(data)
+    return consts
+
+
+# -----------------------------
+# Основной проход расчётов
+# -----------------------------
+def run_all_for_variant(data: VariantData, m: int, nu: int, work_day_hours: int) -> Dict:
+    """
+    Выполняет полный набор расчётов (Задание 1, Задание 2, Задание 3)
+    и возвращает словарь с результатами.
+    """
+    if work_day_hours <= 0:
+        raise ValueError("work_day_hours должен быть > 0")
+    if m <= 0 or nu <= 0:
+        raise ValueError("m и nu должны быть > 0")
+
+    # пункты 1–8, 10 и 12 зависят только от данных варианта
+    consts = _constants_for(data)
+
+    # 9) календарное время (в днях и часах)
+    Tk_days = calendar_time_days(consts.N, m, nu)
+    Tk_hours = Tk_days * work_day_hours
+
     # 11) начальная надёжность t_k (в часах)
-    if B2 <= 1.0:
-        t_k = float('inf')  # логарифм не определён/неподходящая область — считаем бесконечностью
-    else:
-        t_k = Tk_hours / (2.0 * math.log(B2))
+    t_k = Tk_hours * consts.t_k_factor
 
-    # 12) Задание 3 — расчёт рейтингов и ожидаемых ошибок для трёх вариантов c
-    ratings = {}
-    for variant in (1, 2, 3):
-        try:
-            R_new, B_expected = compute_rating_and_expected_errors(data, variant, data.R0)
-        except ZeroDivisionError as e:
-            # в случае проблем (очень малое c_prev) возвращаем None и сообщение
-            R_new, B_expected = None, None
-        ratings[variant] = {"R_new": R_new, "B_expected_next": B_expected}
+    # 12) Задание 3 — предрасчитанные рейтинги и ожидаемые ошибки для трёх вариантов c
+    ratings = {
+        variant: {"R_new": R_new, "B_expected_next": B_expected}
+        for variant, (R_new, B_expected) in consts.ratings.items()
+    }
 
     # собираем результаты в словарь
     return {
-        "n2_star": n2_star,
-        "V_star": V_star,
-        "B1_from_Vstar_lambda": B1,
-        "k_raw": k_raw,
-        "k_simple": k_simple,
-        "K_used": K_used,
-        "N": N,
-        "V": V,
-        "P_asm": P_asm,
+        "n2_star": consts.n2_star,
+        "V_star": consts.V_star,
+        "B1_from_Vstar_lambda": consts.B1,
+        "k_raw": consts.k_raw,
+        "k_simple": consts.k_simple,
+        "K_used": consts.K_used,
+        "N": consts.N,
+        "V": consts.V,
+        "P_asm": consts.P_asm,
         "Tk_days": Tk_days,
         "Tk_hours": Tk_hours,
-        "B2_from_V": B2,
+        "B2_from_V": consts.B2,
         "t_k_hours": t_k,
         "ratings": ratings
     }
@@ -266,20 +382,10 @@ def run_all_for_variant(data: VariantData, m: int, nu: int, work_day_hours: int)
 # -----------------------------
 # CLI и вывод результатов
 # -----------------------------
-def main():
-    parser = argparse.ArgumentParser(description="Расчёт метрик Холстеда (ЛР №3) — исправленная версия")
-    parser.add_argument("-v", "--variant", type=int, default=2, choices=list(TABLE.keys()), help="Номер варианта (по таблице)")
-    parser.add_argument("-m", "--programmers", type=int, default=3, help="Число программистов (m)")
-    parser.add_argument("-n", "--nu", type=int, default=20, help="Производительность ν (команд в день)")
-    parser.add_argument("-w", "--work-hours", type=int, default=8, help="Часов в рабочем дне")
-    args = parser.parse_args()
-
-    data = TABLE[args.variant]
-    results = run_all_for_variant(data, args.programmers, args.nu, args.work_hours)
-
-    # Печатный вывод с пояснениями
+def _print_report(variant: int, data: VariantData, results: Dict) -> None:
+    """Печатает результаты run_all_for_variant с пояснениями (расчёт от печати не зависит)."""
     print("=== РЕЗУЛЬТАТЫ РАСЧЁТА МЕТРИК ХОЛСТЕДА ===\n")
-    print(f"Вариант: {args.variant}")
+    print(f"Вариант: {variant}")
     print(f"Исходные: targets={data.targets}, measurements_per_param={data.measurements_per_param}, "
           f"tracked_params={data.tracked_params}, calculated_params={data.calculated_params}")
     print()
@@ -304,17 +410,32 @@ def main():
     print("=== Задание 3 (рейтинги и ожидаемые ошибки) ===")
     # Для каждого варианта c выводим R_new и B_expected_next.
     # Для вариантов 1 и 2 B_expected_next ожидаемо может быть отрицательным (если c получили отрицательное значение).
-    for variant, vals in results["ratings"].items():
+    for coef_variant, vals in results["ratings"].items():
         Rn = vals["R_new"]
         Be = vals["B_expected_next"]
         if Rn is None:
-            print(f"Variant {variant}: вычисление не удалось (деление на ноль или недопустимые значения)")
+            print(f"Variant {coef_variant}: вычисление не удалось (деление на ноль или недопустимые значения)")
         else:
-            print(f"Variant {variant}: R_new = {Rn:.6f}, B_expected_next = {Be:.6f}")
+            print(f"Variant {coef_variant}: R_new = {Rn:.6f}, B_expected_next = {Be:.6f}")
 
     print("\nПримечание: в соответствии с формулами методички отрицательные значения R_new и B_expected_next")
     print("для некоторых вариантов являются корректным результатом модели (означают деградацию/отрицательную динамику).")
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Расчёт метрик Холстеда (ЛР №3) — исправленная версия")
+    parser.add_argument("-v", "--variant", type=int, default=2, choices=list(TABLE.keys()), help="Номер варианта (по таблице)")
+    parser.add_argument("-m", "--programmers", type=int, default=3, help="Число программистов (m)")
+    parser.add_argument("-n", "--nu", type=int, default=20, help="Производительность ν (команд в день)")
+    parser.add_argument("-w", "--work-hours", type=int, default=8, help="Часов в рабочем дне")
+    args = parser.parse_args()
+
+    data = TABLE[args.variant]
+    results = run_all_for_variant(data, args.programmers, args.nu, args.work_hours)
+
+    # Печатный вывод с пояснениями
+    _print_report(args.variant, data, results)
+
+
 if __name__ == "__main__":
     main()
@@ -13,56 +13,134 @@
 """
 
 import math
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from typing import List, Dict, Sequence, Tuple
 
 __all__ = ["compute"]
 
 
+# Постоянная Эйлера–Маскерони γ
+_EULER_GAMMA = 0.5772156649015329
+
+
+# ---------------------------------------------------------------------
+# Вспомогательные функции
+# ---------------------------------------------------------------------
+def harmonic_sum(m: int) -> float:
+    """
+    Гармоническое число H_m = 1 + 1/2 + ... + 1/m.
+    При m > 20 используется асимптотика ln m + γ + 1/(2m) − 1/(12m²) + 1/(120m⁴)
+    (погрешность порядка 1/(252·m⁶)), иначе — точная сумма.
+    """
+    if m <= 0:
+        return 0.0
+    if m <= 20:
+        return sum(1.0 / k for k in range(1, m + 1))
+    inv_m2 = 1.0 / (m * m)
+    return math.log(m) + _EULER_GAMMA + 0.5 / m - inv_m2 / 12.0 + inv_m2 * inv_m2 / 120.0
+
+
+def _finish_time(B_hat: float, n: int, K_hat: float) -> float:
+    """
+    Оценка времени до конца тестирования по гармонической и логарифмической
+    аппроксимациям; при B̂ ≤ n ошибок не осталось и время равно нулю.
+    """
+    remaining = B_hat - n
+    if remaining <= 0:
+        return 0.0
+    # Выбираем большее из гармонической и логарифмической оценок (устойчивее)
+    return max(harmonic_sum(int(remaining)), math.log(B_hat / remaining)) / K_hat
+
+
 # ---------------------------------------------------------------------
 # Основная численная функция — решение уравнения для B̂
 # ---------------------------------------------------------------------
-def solve_B_newton(X: List[float], tol: float = 1e-10, maxiter: int = 200) -> Tuple[float, int, bool]:
-    """Находит оценку максимального правдоподобия для B̂ методом Ньютона."""
+def solve_B_newton(
+    X: Sequence[float], tol: float = 1e-10, xtol: float = 1e-12, maxiter: int = 200
+) -> Tuple[float, float, int, bool]:
+    """
+    Находит оценку максимального правдоподобия для B̂ методом Ньютона.
+
+    При B → ∞ функция f(B) ведёт себя как (n(n−1)/2 − n·W/Sx) / B², где
+    W = Σ (i − 1)·Xi, поэтому конечный корень существует, только если
+    W / Sx > (n − 1) / 2 (интервалы между ошибками в среднем растут).
+    Корень ищется на отрезке (lo, hi], на концах которого f(B) меняет знак:
+    правая граница отодвигается от n удвоением шага, а шаг Ньютона, выходящий
+    за отрезок, заменяется делением отрезка пополам. Так как f убывает как 1/B²,
+    малое |f| не означает близости к корню, поэтому остановка — по аргументу:
+    отрезок сузился до hi − lo ≤ xtol·max(1, hi) или шаг Ньютона внутри отрезка
+    изменил B относительно меньше чем на xtol (как xtol у brentq).
+
+    Возвращает (B̂, s2, число итераций, признак сходимости), где
+    s2 = Σ (B̂ − i + 1)·Xi — знаменатель оценки K̂ = n / s2.
+    Признак сходимости означает, что найден корень B̂ ≥ n:
+    - если конечного корня нет, возвращается B̂ = ∞ (s2 = ∞) и converged=False;
+    - если f(n) ≤ 0, корень лежит в (n − 1, n]; возвращается B̂ = n, и
+      converged=True только когда n сам является корнем (|f(n)| < tol).
+    """
     n = len(X)
-    Sx = math.fsum(X)
-    data = [(i, Xi) for i, Xi in enumerate(X, start=1)]
-
-    def f_and_s2(B: float) -> Tuple[float, float]:
-        """Возвращает значение функции f(B) и промежуточную сумму s2."""
-        s1 = s2 = 0.0
-        for i, Xi in data:
-            denom = B - i + 1
-            s1 += 1.0 / denom
-            s2 += denom * Xi
-        return s1 - (n * Sx) / s2, s2
-
-    def fprime(B: float, s2: float) -> float:
-        """Производная функции f(B)."""
-        s1 = math.fsum(1.0 / ((B - i + 1) ** 2) for i, _ in data)
-        return -s1 + (n * (Sx ** 2)) / (s2 ** 2)
-
-    # Начальное приближение (чуть выше n)
-    B = n + 2.0
-
-    for it in range(1, maxiter + 1):
-        val, s2 = f_and_s2(B)
-        if abs(val) < tol:
-            return B, it, True
-
-        deriv = fprime(B, s2)
-        if abs(deriv) < 1e-16:
-            deriv = 1e-16
-
-        B_new = B - val / deriv
-        if B_new <= n:
-            B_new = (B + n + 1.0) / 2.0
-
-        if abs(B_new - B) < 1e-12:
-            return B_new, it, True
+    Sx = float(sum(X))
+    nSx = n * Sx
+    # s2(B) = Σ (B − ci)·Xi = B·Sx − W линейна по B, поэтому W считается один раз
+    # (индекс ci = i − 1 отсчитывается с нуля, B − i + 1 = B − ci)
+    W = float(sum(ci * Xi for ci, Xi in enumerate(X)))
+
+    def f_and_fprime(B: float) -> Tuple[float, float]:
+        """f(B) и f'(B) за один проход: одно деление на элемент."""
+        s1 = s1p = 0.0
+        for ci in range(n):
+            inv = 1.0 / (B - ci)
+            s1 += inv
+            s1p += inv * inv
+        s2 = B * Sx - W
+        return s1 - nSx / s2, -s1p + (nSx * Sx) / (s2 * s2)
+
+    # f(B) > 0 при всех больших B — конечной оценки B̂ нет
+    if not 2.0 * W > (n - 1) * Sx:
+        return math.inf, math.inf, 0, False
+
+    # f(n) ≤ 0 — корень не правее n, оценки B̂ > n не существует
+    lo = float(n)
+    val, _ = f_and_fprime(lo)
+    if val <= 0.0:
+        return lo, lo * Sx - W, 1, abs(val) < tol
+
+    # Поиск правой границы: начальное приближение n + 2, затем удвоение расстояния до n
+    hi = n + 2.0
+    for it in range(2, maxiter + 1):
+        val, deriv = f_and_fprime(hi)
+        if val <= 0.0:
+            break
+        lo, hi = hi, n + 2.0 * (hi - n)
+    else:
+        return hi, hi * Sx - W, maxiter, False
+
+    if val == 0.0:
+        return hi, hi * Sx - W, it, True
+
+    # Ньютон внутри отрезка [lo, hi] из точки hi
+    B = hi
+    for it in range(it + 1, maxiter + 1):
+        B_new = B - val / deriv if deriv != 0.0 else math.nan
+        if lo < B_new < hi:
+            if abs(B_new - B) <= xtol * max(1.0, B_new):
+                return B_new, B_new * Sx - W, it, True
+        else:
+            # шаг Ньютона вышел за отрезок — делим отрезок пополам
+            B_new = 0.5 * (lo + hi)
 
         B = B_new
+        val, deriv = f_and_fprime(B)
+        if val == 0.0:
+            return B, B * Sx - W, it, True
+        if val > 0.0:
+            lo = B
+        else:
+            hi = B
+        if hi - lo <= xtol * max(1.0, hi):
+            return B, B * Sx - W, it, True
 
-    return B, maxiter, False
+    return B, B * Sx - W, maxiter, False
 
 
 # ---------------------------------------------------------------------
@@ -86,23 +164,31 @@ def compute(X: List[float]) -> Dict[str, float]:
             "iterations": число итераций,
             "converged": признак сходимости
         }
+
+    Результаты кэшируются по значениям X: повторный вызов с теми же интервалами
+    не решает уравнение заново и возвращает копию сохранённого словаря.
     """
-    n = len(X)
-    B_hat, iterations, converged = solve_B_newton(X)
+    return dict(_compute_cached(tuple(X)))
 
-    denom = math.fsum((B_hat - i + 1) * Xi for i, Xi in enumerate(X, start=1))
-    K_hat = n / denom
 
+@lru_cache(maxsize=32)
+def _compute_cached(X: Tuple[float, ...]) -> Dict[str, float]:
+    """Расчёт для compute(); X — кортеж, чтобы служить ключом кэша."""
+    n = len(X)
+    # s2 на найденном B̂ — это и есть знаменатель K̂, повторный проход по X не нужен
+    B_hat, denom, iterations, converged = solve_B_newton(X)
     remaining = B_hat - n
-    X_next = math.inf if remaining <= 0 else 1.0 / (K_hat * remaining)
 
-    # Гармоническая и логарифмическая аппроксимации для времени до конца тестирования
-    if remaining > 0:
-        H_m = math.fsum(1.0 / k for k in range(1, int(remaining) + 1))
-        # Выбираем большее из гармонической и логарифмической оценок (устойчивее)
-        time_to_finish = max(H_m, math.log(B_hat / (B_hat - n))) / K_hat
+    if math.isinf(B_hat):
+        # Конечной оценки нет: K̂ → 0, а K̂·(B̂ − n) → n / Sx,
+        # поэтому Xₙ₊₁ — средний интервал, а тестирование не заканчивается
+        K_hat = 0.0
+        X_next = sum(X) / n
+        time_to_finish = math.inf
     else:
-        time_to_finish = 0.0
+        K_hat = n / denom
+        X_next = math.inf if remaining <= 0 else 1.0 / (K_hat * remaining)
+        time_to_finish = _finish_time(B_hat, n, K_hat)
 
     return {
         "n": n,
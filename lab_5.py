@@ -1,6 +1,8 @@
+import math
+import operator
+from functools import lru_cache
 from pprint import pp
-from typing import List, Dict, Any, Optional
-from statistics import mean
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
 
 DOC = """ГОСТ 28195-89 — расчет показателей надежности ПС для лабораторной работы №5.
@@ -17,6 +19,20 @@ DOC = """ГОСТ 28195-89 — расчет показателей надежн
 """
 
 
+# Скалярное произведение за один проход: math.sumprod есть с Python 3.12,
+# в более ранних версиях — сумма произведений через math.fsum
+if hasattr(math, "sumprod"):
+    _sumprod = math.sumprod
+else:
+    def _sumprod(p: List[float], q: List[float]) -> float:
+        return math.fsum(map(operator.mul, p, q))
+
+
+def _avg(xs: List[float]) -> float:
+    # Среднее через math.fsum / len — без рациональной арифметики statistics.mean
+    return math.fsum(xs) / len(xs)
+
+
 def h0401_prob_no_failure(Q: int, N: int) -> float:
     if N <= 0:
         raise ValueError("N must be > 0")
@@ -28,7 +44,7 @@ def h0401_prob_no_failure(Q: int, N: int) -> float:
 def tv_mean(Tv_samples: List[float]) -> float:
     if not Tv_samples:
         raise ValueError("Tv_samples must be non-empty")
-    return float(mean(Tv_samples))
+    return _avg(Tv_samples)
 
 
 def h0501_restore_time_score(Tv_avg: float, T_dopV: float) -> float:
@@ -48,7 +64,7 @@ def h0502_transform_time_scores(Tpi_samples: List[float], T_dopp: float) -> List
 def average(values: List[float]) -> float:
     if not values:
         raise ValueError("Cannot average empty list")
-    return float(mean(values))
+    return _avg(values)
 
 
 def metric_score(oe_values: List[float]) -> float:
@@ -62,10 +78,45 @@ def weighted_average(values: List[float], weights: Optional[List[float]] = None)
         return average(values)
     if len(weights) != len(values):
         raise ValueError("weights and values length mismatch")
-    s = sum(weights)
+    s = math.fsum(weights)
     if s <= 0:
         raise ValueError("sum of weights must be > 0")
-    return sum(v * w for v, w in zip(values, weights)) / s
+    return _sumprod(values, weights) / s
+
+
+class ReliabilityResult(NamedTuple):
+    """Результаты compute_all; as_dict() даёт словарь с подписями показателей для вывода."""
+    n0401: float               # Н0401 — вероятность безотказной работы (P)
+    tv_avg: float              # ТВ — среднее время восстановления (Тв)
+    n0501: float               # Н0501 — по среднему времени восстановления (Qв)
+    n0502_avg: float           # Н0502 — по времени преобразования, среднее (Qпi)
+    metric4: float             # Метрика 4 (mkq)
+    metric5: float             # Метрика 5 (Pjk m)
+    absolute_criterion: float  # Абсолютный показатель критерия (Pij)
+    relative_criterion: float  # Относительный показатель критерия (Kij)
+    quality_factor: float      # Фактор качества (KiФ)
+    n0502_min: float
+    n0502_max: float
+    n0502_count: int
+    n0502_list: Tuple[float, ...]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "Н0401 — вероятность безотказной работы (P)": self.n0401,
+            "ТВ — среднее время восстановления, с (Тв)": self.tv_avg,
+            "Н0501 — по среднему времени восстановления (Qв)": self.n0501,
+            "Н0502 — по времени преобразования (среднее по всем наборам) (Qпi)": self.n0502_avg,
+            "Метрика 4 — функционирование в заданных режимах (mkq)": self.metric4,
+            "Метрика 5 — обработка заданного объема информации (Pjk m)": self.metric5,
+            "Абсолютный показатель критерия «работоспособность» (Pij)": self.absolute_criterion,
+            "Относительный показатель критерия «работоспособность» (Kij)": self.relative_criterion,
+            "Фактор качества (надежность ПС) (KiФ)": self.quality_factor,
+            "Н0502 — min": self.n0502_min,
+            "Н0502 — max": self.n0502_max,
+            "Н0502 — count": self.n0502_count,
+            "H502 - list": list(self.n0502_list),
+            "Примечание": "Метрика 4 = Н0401; Метрика 5 = среднее(Н0501, Н0502_среднее). Веса метрик равные по умолчанию.",
+        }
 
 
 def compute_all(
@@ -77,7 +128,29 @@ def compute_all(
     T_dopp: float,
     P_baz: float,
     metric_weights: Optional[Dict[str, float]] = None,
-) -> Dict[str, Any]:
+) -> ReliabilityResult:
+    # Расчёт детерминирован, поэтому кэшируется: списки приводятся к кортежам,
+    # из весов метрик берутся только используемые веса метрик 4 и 5.
+    # Результат неизменяемый, поэтому из кэша его можно возвращать без копирования.
+    if metric_weights is None:
+        w4, w5 = 0.5, 0.5
+    else:
+        w4, w5 = metric_weights.get("4", 0.0), metric_weights.get("5", 0.0)
+    return _compute_all_cached(Q, N, tuple(Tv_samples), T_dopV, tuple(Tpi_samples), T_dopp, P_baz, w4, w5)
+
+
+@lru_cache(maxsize=128)
+def _compute_all_cached(
+    Q: int,
+    N: int,
+    Tv_samples: Tuple[float, ...],
+    T_dopV: float,
+    Tpi_samples: Tuple[float, ...],
+    T_dopp: float,
+    P_baz: float,
+    w4: float,
+    w5: float,
+) -> ReliabilityResult:
     n0401 = h0401_prob_no_failure(Q, N)
     tv_avg = tv_mean(Tv_samples)
     n0501 = h0501_restore_time_score(tv_avg, T_dopV)
@@ -87,41 +160,37 @@ def compute_all(
     metric4 = metric_score([n0401])
     metric5 = metric_score([n0501, n0502_avg])
 
-    if metric_weights is None:
-        w4 = w5 = 0.5
-    else:
-        w4 = metric_weights.get("4", 0.0)
-        w5 = metric_weights.get("5", 0.0)
-        s = w4 + w5
-        if s <= 0:
-            raise ValueError("Sum of metric weights must be > 0")
-        w4 /= s
-        w5 /= s
+    s = w4 + w5
+    if s <= 0:
+        raise ValueError("Sum of metric weights must be > 0")
+    w4 /= s
+    w5 /= s
 
-    absolute_criterion = weighted_average([metric4, metric5], [w4, w5])
+    # веса уже нормированы, поэтому взвешенное среднее двух метрик — просто сумма произведений
+    absolute_criterion = metric4 * w4 + metric5 * w5
 
     if P_baz <= 0:
         raise ValueError("P_baz (базовый показатель) must be > 0")
     relative_criterion = absolute_criterion / P_baz
     quality_factor = relative_criterion
 
-    return {
-        "Н0401 — вероятность безотказной работы (P)": n0401,
-        "ТВ — среднее время восстановления, с (Тв)": tv_avg,
-        "Н0501 — по среднему времени восстановления (Qв)": n0501,
-        "Н0502 — по времени преобразования (среднее по всем наборам) (Qпi)": n0502_avg,
-        "Метрика 4 — функционирование в заданных режимах (mkq)": metric4,
-        "Метрика 5 — обработка заданного объема информации (Pjk m)": metric5,
-        "Абсолютный показатель критерия «работоспособность» (Pij)": absolute_criterion,
-        "Относительный показатель критерия «работоспособность» (Kij)": relative_criterion,
-        "Фактор качества (надежность ПС) (KiФ)": quality_factor,
-        "Н0502 — min": min(n0502_list),
-        "Н0502 — max": max(n0502_list),
-        "Н0502 — count": len(n0502_list),
-        "H502 - list": n0502_list,
-        "Примечание": "Метрика 4 = Н0401; Метрика 5 = среднее(Н0501, Н0502_среднее). Веса метрик равные по умолчанию.",
-    }
-
-
-pp(compute_all(Q=6, N=1200, Tv_samples=[
-    0.8, 1.4], T_dopV=0.95, Tpi_samples=[8, 12], T_dopp=14, P_baz=0.94))
+    return ReliabilityResult(
+        n0401=n0401,
+        tv_avg=tv_avg,
+        n0501=n0501,
+        n0502_avg=n0502_avg,
+        metric4=metric4,
+        metric5=metric5,
+        absolute_criterion=absolute_criterion,
+        relative_criterion=relative_criterion,
+        quality_factor=quality_factor,
+        n0502_min=min(n0502_list),
+        n0502_max=max(n0502_list),
+        n0502_count=len(n0502_list),
+        n0502_list=tuple(n0502_list),
+    )
+
+
+if __name__ == "__main__":
+    pp(compute_all(Q=6, N=1200, Tv_samples=[
+        0.8, 1.4], T_dopV=0.95, Tpi_samples=[8, 12], T_dopp=14, P_baz=0.94).as_dict())
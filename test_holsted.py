@@ -1,5 +1,7 @@
 import math
-from holstead_lab3 import TABLE, run_all_for_variant
+import dataclasses
+import pytest
+from holstead_lab3 import TABLE, VariantData, modules_count, run_all_for_variant, compute_all_ratings, compute_rating_and_expected_errors
 
 def test_run_variant_basic_properties():
     data = TABLE[2]
@@ -30,3 +32,54 @@ def test_run_variant_basic_properties():
     for v in results["ratings"].values():
         assert math.isfinite(v["R_new"])
         assert math.isfinite(v["B_expected_next"])
+
+
+def test_equal_variant_copy_gives_same_results():
+    # равная копия варианта находит те же предрасчитанные величины
+    data = TABLE[2]
+    copy = dataclasses.replace(data)
+    assert run_all_for_variant(copy, m=3, nu=20, work_day_hours=8) == \
+        run_all_for_variant(data, m=3, nu=20, work_day_hours=8)
+
+
+def test_custom_variant_is_validated():
+    # вариант вне таблицы считается заново, с проверкой входных данных
+    data = dataclasses.replace(TABLE[2], n_programs=4)
+    with pytest.raises(ValueError):
+        run_all_for_variant(data, m=3, nu=20, work_day_hours=8)
+
+
+def test_all_ratings_match_single_variant_calls():
+    data = TABLE[2]
+    ratings = compute_all_ratings(data, data.R0)
+    assert set(ratings) == {1, 2, 3}
+    for variant, pair in ratings.items():
+        assert pair == compute_rating_and_expected_errors(data, variant, data.R0)
+
+
+def test_variant_from_lists():
+    # вариант можно задать списками, как раньше; результат совпадает с табличным
+    data = VariantData(
+        targets=25,
+        measurements_per_param=28,
+        tracked_params=8,
+        calculated_params=3,
+        R0=2000.0,
+        lambda_lang=1.6,
+        n_programs=3,
+        volumes_kb=[4.0, 8.0, 10.0],
+        errors_list=[1, 2, 4],
+        planned_kb=14,
+    )
+    assert data == TABLE[2]
+    assert run_all_for_variant(data, 3, 20, 8) == run_all_for_variant(TABLE[2], 3, 20, 8)
+
+
+@pytest.mark.parametrize("n2_star", [0, 7, 8, 9, 9.0, 9.5, 17.0, 700])
+def test_modules_count_rounds_up(n2_star):
+    # lru_cache не различает 9 и 9.0 — очищаем кэш, чтобы float-аргумент действительно считался
+    modules_count.cache_clear()
+    k_raw, k_simple = modules_count(n2_star)
+    assert k_raw == n2_star / 8.0
+    assert k_simple == math.ceil(n2_star / 8.0)
+    assert isinstance(k_simple, int)
@@ -1,6 +1,7 @@
-# test_jm_model.py
+# test_jv_model.py
+import math
 import pytest
-from jelinski_moranda import compute
+from jelinski_moranda import compute, harmonic_sum, solve_B_newton
 
 variants = {
     1: [9,12,11,4,7,2,5,8,5,7,1,6,1,9,4,1,3,3,6,1,1,11,33,7,91,2],
@@ -31,3 +32,60 @@ def test_all_variants(v, X):
 def banner():
     """Вывод заголовка таблицы перед тестами"""
     print_header()
+
+
+@pytest.mark.parametrize("m", [0, 1, 5, 20, 21, 50, 500, 5000])
+def test_harmonic_sum_matches_exact(m):
+    exact = math.fsum(1.0 / k for k in range(1, m + 1))
+    assert harmonic_sum(m) == pytest.approx(exact, rel=1e-10, abs=1e-12)
+
+
+def test_compute_returns_independent_copies():
+    X = variants[1]
+    first = compute(X)
+    first["B_hat"] = -1.0
+    assert compute(list(X))["B_hat"] > len(X)
+
+
+def test_solver_reports_missing_root_above_n():
+    # при f(n) ≤ 0 оценки B̂ > n нет — решатель не должен «сходиться» на бесконечности
+    B, _, _, converged = solve_B_newton([1, 1, 1, 1, 100])
+    assert not converged
+    assert B == 5.0
+
+
+def test_solver_does_not_stop_at_doubling_bound():
+    # при большом B̂ функция f почти плоская: малое |f| на границе отрезка ещё не корень
+    X = [4, 76.966, 142, 8, 24, 10, 88.083]
+    B, _, _, converged = solve_B_newton(X)
+    assert converged
+    n, Sx = len(X), math.fsum(X)
+
+    def f(b):
+        return math.fsum(1.0 / (b - ci) for ci in range(n)) - n * Sx / math.fsum((b - ci) * x for ci, x in enumerate(X))
+
+    assert f(B * (1 - 1e-6)) > 0 > f(B * (1 + 1e-6))
+    assert B == pytest.approx(4457.88, rel=1e-5)
+
+
+@pytest.mark.parametrize("v,X", variants.items())
+def test_solver_returns_k_hat_denominator(v, X):
+    B, s2, _, _ = solve_B_newton(X)
+    direct = math.fsum((B - i + 1) * Xi for i, Xi in enumerate(X, start=1))
+    assert s2 == pytest.approx(direct, rel=1e-12)
+
+
+@pytest.mark.parametrize("X", [[5] * 10, [100, 50, 20, 10, 5, 2, 1]])
+def test_no_finite_estimate_for_flat_or_decreasing_intervals(X):
+    # интервалы не растут — конечной оценки B̂ нет, сходимость не должна сообщаться
+    res = compute(X)
+    assert not res["converged"]
+    assert res["B_hat"] == math.inf
+    assert res["time_to_finish"] == math.inf
+
+
+def test_root_exactly_at_n_is_converged():
+    # f(n) = 0: B̂ = n — корень, ошибок не осталось
+    B, _, _, converged = solve_B_newton([1, 2])
+    assert converged
+    assert B == 2.0
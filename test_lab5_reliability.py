@@ -20,7 +20,7 @@ from lab_5 import compute_all  # важно: имя файла lab_5.py → им
 )
 def test_reliability_variant(capsys, variant, params):
     """Проверка расчета фактора надежности по ГОСТ 28195-89 для указанного варианта."""
-    result = compute_all(**params)
+    result = compute_all(**params).as_dict()
 
     print(f"\n=== РЕЗУЛЬТАТ РАСЧЕТА ФАКТОРА НАДЕЖНОСТИ — Вариант {variant} ===")
     for key, val in result.items():
@@ -37,3 +37,12 @@ def test_reliability_variant(capsys, variant, params):
 
     captured = capsys.readouterr()
     assert "РЕЗУЛЬТАТ РАСЧЕТА" in captured.out
+
+
+def test_repeated_calls_return_independent_results():
+    params = dict(Q=6, N=1200, Tv_samples=[0.8, 1.4], T_dopV=0.95, Tpi_samples=[8, 12], T_dopp=14, P_baz=0.94)
+    first = compute_all(**params).as_dict()
+    first["H502 - list"].append(0.0)
+    second = compute_all(**params)
+    assert second.n0502_list == (1.0, 1.0)
+    assert second.as_dict() == {**first, "H502 - list": [1.0, 1.0]}